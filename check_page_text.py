@@ -0,0 +1,70 @@
+"""
+Check read_pages() (PDFium characters) against pdfplumber's own extract_text()
+on a folder of SLIK PDFs: every facility-section heading and bank-block header
+found in the pdfplumber text must also be found, in order, in the PDFium text,
+and both texts must give the same kredit records.
+
+Usage:
+    python check_page_text.py [folder]      (default: slik_data)
+"""
+
+import os
+import sys
+
+from slik_extractor import (
+    _BLOCK_MARKER_STR_RE, _MARKER_GROUP, _scan_markers, extract_credit_blocks, read_pages,
+)
+
+
+def _plumber_pages(pdf_path: str) -> list[str]:
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text(x_tolerance=3, y_tolerance=3) or "" for page in pdf.pages]
+
+
+def _markers(full_text: str) -> tuple[list[tuple], list[str]]:
+    """(kode, pelapor, baki, tgl) per bank header and the facility heading labels."""
+    bank_headers, headings = _scan_markers(full_text, _BLOCK_MARKER_STR_RE)
+    fields = [_MARKER_GROUP[k] for k in ("kode", "pelapor", "baki", "tgl")]
+    return [hm.group(*fields) for hm in bank_headers], [label for _, label in headings]
+
+
+def check_pdf(pdf_path: str) -> list[str]:
+    """Problems found for one PDF (empty when both texts agree)."""
+    plumber_pages = _plumber_pages(pdf_path)
+    pdfium_pages  = read_pages(pdf_path, max_workers=1)
+    plumber_text  = "\n".join(plumber_pages)
+    pdfium_text   = "\n".join(pdfium_pages)
+
+    problems = []
+    plumber_headers, plumber_headings = _markers(plumber_text)
+    pdfium_headers, pdfium_headings   = _markers(pdfium_text)
+    if pdfium_headings != plumber_headings:
+        problems.append(f"facility headings {pdfium_headings} != {plumber_headings}")
+    if pdfium_headers != plumber_headers:
+        problems.append(f"{len(pdfium_headers)} bank headers != {len(plumber_headers)} expected")
+    if extract_credit_blocks(pdfium_text) != extract_credit_blocks(plumber_text):
+        problems.append("kredit records differ")
+
+    changed = sum(a != b for a, b in zip(plumber_pages, pdfium_pages))
+    if changed:
+        print(f"  note: {changed} of {len(plumber_pages)} page texts differ "
+              "(markers and records still compared above)")
+    return problems
+
+
+if __name__ == "__main__":
+    folder = sys.argv[1] if len(sys.argv) > 1 else "slik_data"
+    failed = 0
+    for filename in sorted(os.listdir(folder)):
+        if not filename.lower().endswith(".pdf"):
+            continue
+        print(filename)
+        for problem in check_pdf(os.path.join(folder, filename)):
+            print(f"  ✗ {problem}")
+            failed += 1
+    if failed:
+        print(f"\n{failed} problem(s) found.")
+        sys.exit(1)
+    print("\n✅ PDFium text matches pdfplumber on markers and records.")
@@ -1,15 +1,119 @@
+import asyncio
 import os
 
+try:                    # optional: batch renames through io_uring (Linux 5.11+)
+    import liburing
+except ImportError:
+    liburing = None
+
 folder_path = r"./"
+RING_ENTRIES = 256      # renames submitted per io_uring_enter
+
+
+def rename_no_clobber(old_path: str, new_path: str) -> None:
+    """Rename old_path to new_path, raising FileExistsError instead of overwriting."""
+    if os.name == "nt":
+        os.rename(old_path, new_path)   # Windows rename already refuses to overwrite
+        return
+    # POSIX rename() silently replaces the target; link() fails atomically instead,
+    # so there is no separate exists() check that could race with another writer.
+    try:
+        os.link(old_path, new_path)
+    except FileExistsError:
+        raise
+    except OSError:
+        # No hard links on this filesystem (FAT, some network shares): claim the
+        # name with an exclusive create, then move the file over the placeholder.
+        os.close(os.open(new_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        try:
+            os.replace(old_path, new_path)
+        except OSError:
+            os.unlink(new_path)
+            raise
+        return
+    os.unlink(old_path)
+
+
+def _rename_with_io_uring(pairs: list[tuple[str, str]]):
+    """
+    Yield (index, error) as renames complete, RING_ENTRIES per submission.
+    Each rename is a single renameat2(RENAME_NOREPLACE), so an existing target
+    comes back as FileExistsError. Other failures are not yielded (e.g. a kernel
+    without IORING_OP_RENAMEAT answers EINVAL) and are left to the caller.
+    """
+    ring = liburing.Ring()
+    cqe  = liburing.Cqe()
+    liburing.io_uring_queue_init(RING_ENTRIES, ring)
+    try:
+        for base in range(0, len(pairs), RING_ENTRIES):
+            batch = pairs[base:base + RING_ENTRIES]
+            for index, (old_path, new_path) in enumerate(batch, base):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_rename(sqe, old_path, new_path, liburing.RENAME_NOREPLACE)
+                sqe.user_data = index
+            liburing.io_uring_submit_and_wait(ring, len(batch))
+
+            done = 0
+            while done < len(batch):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                ready = liburing.io_uring_cq_ready(ring)
+                for k in range(ready):
+                    entry = cqe[k]
+                    index = entry.user_data
+                    try:
+                        entry.res   # raises the errno of a failed rename
+                    except FileExistsError as e:
+                        yield index, e
+                    except OSError:
+                        pass
+                    else:
+                        yield index, None
+                liburing.io_uring_cq_advance(ring, ready)
+                done += ready
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+async def _rename_in_threads(pairs: list[tuple[str, str]]) -> list:
+    """Run rename_no_clobber for all pairs on the default thread pool; None or the error."""
+    return await asyncio.gather(
+        *(asyncio.to_thread(rename_no_clobber, old, new) for old, new in pairs),
+        return_exceptions=True,
+    )
+
+
+def rename_all(pairs: list[tuple[str, str]]):
+    """Yield (index, error or None) for every (old_path, new_path) pair, in completion order."""
+    done = set()
+    if liburing is not None:
+        try:
+            for index, error in _rename_with_io_uring(pairs):
+                done.add(index)
+                yield index, error
+        except OSError:
+            pass    # io_uring not usable here (old kernel, seccomp); finish below
+    rest = [i for i in range(len(pairs)) if i not in done]
+    if rest:
+        results = asyncio.run(_rename_in_threads([pairs[i] for i in rest]))
+        yield from zip(rest, results)
+
 
-for filename in os.listdir(folder_path):
-    if filename.lower().endswith(".pdf") and " " in filename:
-        old_path = os.path.join(folder_path, filename)
-        new_name = filename.replace(" ", "_")
-        new_path = os.path.join(folder_path, new_name)
+if __name__ == "__main__":
+    names = []
+    pairs = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            filename = entry.name
+            if filename.lower().endswith(".pdf") and " " in filename and entry.is_file():
+                new_name = filename.replace(" ", "_")
+                names.append((filename, new_name))
+                pairs.append((entry.path, os.path.join(folder_path, new_name)))
 
-        if not os.path.exists(new_path):
-            os.rename(old_path, new_path)
+    for index, error in rename_all(pairs):
+        filename, new_name = names[index]
+        if error is None:
             print(f"Renamed: {filename} -> {new_name}")
+        elif isinstance(error, FileExistsError):
+            print(f"Skipped (already exists): {new_name}")
         else:
-            print(f"Skipped (already exists): {new_name}")
\ No newline at end of file
+            print(f"Failed: {filename} ({error})")
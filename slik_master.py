@@ -1,43 +1,83 @@
+import hashlib
+import json
 import os
-import pdfplumber
 import re
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 
-from slik_extractor import extract_credit_blocks, extract_debitur_name, extract_nomor_laporan
+from slik_extractor import (
+    COLUMNS, KREDIT_FIELDS, READ_PAGES_VERSION,
+    extract_credit_blocks, extract_debitur_name, extract_nomor_laporan, read_pages,
+)
 
 
 folder_path = "slik_data"
-all_records = []
+cache_dir = ".cache"      # extracted page text, keyed by PDF content hash
+MASTER_COLUMNS = COLUMNS + ["Nama Debitur"]
 
-for filename in os.listdir(folder_path):
-    if filename.lower().endswith(".pdf"):
-        full_path = os.path.join(folder_path, filename)
-        print(f"Memproses: {filename}")
 
-        # Baca seluruh teks PDF
-        pages_text = []
-        with pdfplumber.open(full_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text(x_tolerance=3, y_tolerance=3) or ""
-                pages_text.append(text)
+def _read_pages_cached(full_path: str) -> list[str]:
+    """Page texts of a PDF, from cache_dir when this exact file was read before."""
+    with open(full_path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{digest}-v{READ_PAGES_VERSION}.json")
+    if os.path.exists(cache_path):
+        with open(cache_path, encoding="utf-8") as f:
+            return json.load(f)
 
-        full_text = "\n".join(pages_text)
+    # Baca seluruh teks PDF (files are already spread over processes)
+    pages_text = read_pages(full_path, max_workers=1)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        # ASCII-escaped, so lone surrogates in the page text round-trip too
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(pages_text, f)
+        os.replace(tmp_path, cache_path)   # never leave a half-written cache file
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return pages_text
 
-        debitur = extract_debitur_name(full_text)
-        nomor_laporan = extract_nomor_laporan(full_text)
-        records = extract_credit_blocks(full_text)
 
-        for r in records:
-            r["Nama Debitur"] = debitur
-            r["Nomor Laporan"] = nomor_laporan
-            all_records.append(r)
+def _process_one(full_path: str) -> dict[str, list]:
+    """Read one SLIK PDF and return its kredit records column-wise (runs in a worker process)."""
+    print(f"Memproses: {os.path.basename(full_path)}")
 
+    full_text = "\n".join(_read_pages_cached(full_path))
 
-if not all_records:
-    print("Tidak ada data ditemukan.")
-else:
-    df = pd.DataFrame(all_records)
+    debitur = extract_debitur_name(full_text)
+    nomor_laporan = extract_nomor_laporan(full_text)
 
-    df.to_excel("MASTER_SLIK.xlsx", index=False)
-    print("\n✅ MASTER_SLIK.xlsx berhasil dibuat!")
-    print(f"Total baris: {len(df)}")
+    cols = {k: [] for k in MASTER_COLUMNS}
+    for r in extract_credit_blocks(full_text):
+        r.nomor_laporan = nomor_laporan
+        for k, name in zip(COLUMNS, KREDIT_FIELDS):
+            cols[k].append(getattr(r, name))
+        cols["Nama Debitur"].append(debitur)
+    return cols
+
+
+if __name__ == "__main__":
+    with os.scandir(folder_path) as entries:
+        paths = [entry.path for entry in entries if entry.name.lower().endswith(".pdf")]
+
+    # Each PDF is independent and parsing is CPU-bound, so spread files
+    # across processes; map() keeps the results in listing order.
+    # Rows are gathered column-wise (one list per column) rather than as dicts.
+    cols = {k: [] for k in MASTER_COLUMNS}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for file_cols in ex.map(_process_one, paths):
+            for k in MASTER_COLUMNS:
+                cols[k].extend(file_cols[k])
+
+    if not cols["Bank (Pelapor)"]:
+        print("Tidak ada data ditemukan.")
+    else:
+        import pandas as pd   # only needed once there is something to write
+
+        df = pd.DataFrame(cols)
+
+        df.to_excel("MASTER_SLIK.xlsx", index=False, engine="xlsxwriter")
+        print("\n✅ MASTER_SLIK.xlsx berhasil dibuat!")
+        print(f"Total baris: {len(df)}")